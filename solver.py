@@ -5,24 +5,133 @@ Python 3.12, zero external dependencies.
 """
 
 import os
-import re
 import sys
 import time
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from string import Template
+
+
+# README markers delimiting the latest-solve section
+SECTION_START = '<!-- SUDOKU-START -->'
+SECTION_END = '<!-- SUDOKU-END -->'
+SECTION_END_LEN = len(SECTION_END)
+
+# Output templates
+README_SOLVE_TEMPLATE = Template(SECTION_START + """
+
+**Latest Solve** • Solved in $time_ms ms • Difficulty: $difficulty_emoji $difficulty_name • Backtracks: $backtracks • Clues: $clues
+
+$solution_display
+
+**Original Puzzle**
+
+$original_str
+
+Last solved: $timestamp UTC (commit $sha)  
+View recent solves → ./history/
+
+""" + SECTION_END)
+
+README_ERROR_TEMPLATE = Template(SECTION_START + """
+
+**Error** ⚠️ Could not solve puzzle
+
+$error_msg
+
+**Original Puzzle**
+
+$original_str
+
+Last attempt: $timestamp UTC (commit $sha)
+
+""" + SECTION_END)
+
+# Scaffold used when README.md does not exist yet
+README_TEMPLATE = Template("""# Sudoku Solver Portal
+
+Public 9×9 Sudoku solver running in GitHub Actions.  
+Submit puzzles easily via the web editor or by editing puzzle/current.txt → open PR → auto-merges if only that file changed.
+
+### Submit a Puzzle
+
+Visit the web editor at https://projectaberto.github.io/sudokusolver/ to fill the grid visually.
+
+---
+
+   ~~~~~ Wubba Lubba Dub Dub ~~~~~ [burp] ~~~~~
+   ╔═══════════════════[ Latest Solve Portal ]═══════════════════╗
+
+$section
+
+Wubba lubba dub dub! 🚀
+""")
+
+HISTORY_TEMPLATE = Template("""# Sudoku Solution - $timestamp
+
+**Metadata**
+- Solved at: $timestamp UTC
+- Commit: $sha
+- Difficulty: $difficulty_emoji $difficulty_name
+- Clues: $clues
+- Backtracks: $backtracks
+- Time: $time_ms ms
+
+**Original Puzzle**
+```
+$original_str
+```
+
+**Solution**
+```
+$solution_display
+```
+
+**Solution (compact)**
+```
+$solution_str
+```
+""")
 
 
 # ============================================================================
 # Sudoku Solver
 # ============================================================================
 
+def _peer_indices(pos):
+    """Return the 20 positions sharing a row, column or box with pos."""
+    row, col = pos // 9, pos % 9
+    box_row, box_col = (row // 3) * 3, (col // 3) * 3
+    peers = {row * 9 + j for j in range(9)}
+    peers.update(i * 9 + col for i in range(9))
+    peers.update(i * 9 + j for i in range(box_row, box_row + 3) for j in range(box_col, box_col + 3))
+    peers.discard(pos)
+    return sorted(peers)
+
+
+# Lookup tables indexed by packed position r*9+c
+ROW_OF = tuple(pos // 9 for pos in range(81))
+COL_OF = tuple(pos % 9 for pos in range(81))
+BOX_OF = tuple((r // 3) * 3 + c // 3 for r in range(9) for c in range(9))
+PEERS = tuple(tuple(_peer_indices(pos)) for pos in range(81))
+
+
+# Byte translation for puzzle chars: '.' -> 0, '1'-'9' -> 1-9, else invalid
+INVALID_CELL = 0xFF
+PARSE_TABLE = bytes(
+    0 if ch == ord('.') else ch - ord('0') if ord('1') <= ch <= ord('9') else INVALID_CELL
+    for ch in range(256)
+)
+
+
 def parse_grid(puzzle_str):
     """
-    Parse puzzle string into 9x9 grid.
+    Parse puzzle string into a flat grid.
     
     Input: 9 lines, 9 chars each (1-9 or . for empty)
-    Output: 2D list (0=empty, 1-9=clue)
+    Output: bytearray of 81 cells, row-major (0=empty, 1-9=clue)
     Returns None if invalid format.
     """
     lines = puzzle_str.strip().split('\n')
@@ -30,93 +139,192 @@ def parse_grid(puzzle_str):
     if len(lines) != 9:
         return None
     
-    grid = []
     for line in lines:
         if len(line) != 9:
             return None
-        
-        row = []
-        for char in line:
-            if char == '.':
-                row.append(0)
-            elif char.isdigit() and 1 <= int(char) <= 9:
-                row.append(int(char))
-            else:
-                return None
-        grid.append(row)
     
-    return grid
+    try:
+        cells = ''.join(lines).encode('ascii').translate(PARSE_TABLE)
+    except UnicodeEncodeError:
+        return None
+    if INVALID_CELL in cells:
+        return None
+    
+    return bytearray(cells)
+
+
+def grid_as_2d(grid):
+    """Convert a flat 81-cell grid into a 9x9 list of rows."""
+    if grid is None:
+        return None
+    return [list(grid[i * 9:(i + 1) * 9]) for i in range(9)]
 
 
 def count_clues(grid):
     """Count number of given clues in the grid."""
     if grid is None:
         return 0
-    return sum(1 for row in grid for cell in row if cell != 0)
+    return 81 - grid.count(0)
 
 
 def is_valid(grid, row, col, num):
-    """Check if placing num at grid[row][col] is valid."""
-    # Check row
-    if num in grid[row]:
-        return False
+    """Check if placing num at grid[row*9+col] is valid."""
+    for peer in PEERS[row * 9 + col]:
+        if grid[peer] == num:
+            return False
     
-    # Check column
-    if num in [grid[i][col] for i in range(9)]:
-        return False
+    return True
+
+
+def _assign(flat, rows, cols, boxes, pos, bit, trail):
+    """
+    Place bit at pos, then propagate naked singles to its peers.
     
-    # Check 3x3 box
-    box_row, box_col = (row // 3) * 3, (col // 3) * 3
-    for i in range(box_row, box_row + 3):
-        for j in range(box_col, box_col + 3):
-            if grid[i][j] == num:
+    Every placed position is pushed onto trail so _undo can unwind it.
+    Returns False on contradiction (a peer left with no candidates).
+    """
+    work = [(pos, bit)]
+    while work:
+        pos, bit = work.pop()
+        if flat[pos]:
+            continue
+        r, c, b = ROW_OF[pos], COL_OF[pos], BOX_OF[pos]
+        if (rows[r] | cols[c] | boxes[b]) & bit:
+            return False
+        rows[r] |= bit
+        cols[c] |= bit
+        boxes[b] |= bit
+        flat[pos] = bit.bit_length()
+        trail.append(pos)
+        
+        for peer in PEERS[pos]:
+            if flat[peer]:
+                continue
+            pr, pc, pb = ROW_OF[peer], COL_OF[peer], BOX_OF[peer]
+            mask = ~(rows[pr] | cols[pc] | boxes[pb]) & 0x1FF
+            if mask == 0:
                 return False
+            if mask & (mask - 1) == 0:
+                work.append((peer, mask))
     
     return True
 
 
+def _undo(flat, rows, cols, boxes, trail, mark):
+    """Unwind placements recorded on trail back to length mark."""
+    while len(trail) > mark:
+        pos = trail.pop()
+        r, c, b = ROW_OF[pos], COL_OF[pos], BOX_OF[pos]
+        bit = 1 << (flat[pos] - 1)
+        rows[r] ^= bit
+        cols[c] ^= bit
+        boxes[b] ^= bit
+        flat[pos] = 0
+
+
+def _select(flat, rows, cols, boxes, empties):
+    """
+    Pick the unfilled cell with the fewest candidates (MRV).
+    
+    Returns (pos, candidates_mask); pos is -1 when every cell is filled.
+    """
+    pos, best_count, avail = -1, 10, 0
+    for p in empties:
+        if flat[p]:
+            continue
+        r, c, b = ROW_OF[p], COL_OF[p], BOX_OF[p]
+        mask = ~(rows[r] | cols[c] | boxes[b]) & 0x1FF
+        count = mask.bit_count()
+        if count < best_count:
+            pos, best_count, avail = p, count, mask
+            if count <= 1:
+                break
+    return pos, avail
+
+
+def _solve(flat, rows, cols, boxes, empties):
+    """
+    Backtracking kernel over a flat 81-cell buffer.
+    
+    empties holds packed positions (r*9+c) of the cells that were empty in
+    the puzzle. Each open guess is kept on an explicit stack as
+    (pos, remaining_candidates, trail_mark), so there is no recursion.
+    Returns (solved, backtrack_count); flat holds the solution if solved.
+    """
+    trail = []
+    stack = []
+    backtracks = 0
+    
+    pos, avail = _select(flat, rows, cols, boxes, empties)
+    if pos == -1:
+        return True, 0
+    
+    while True:
+        if not avail:
+            # Candidates exhausted: reopen the previous guess
+            if not stack:
+                return False, backtracks
+            pos, avail, mark = stack.pop()
+            _undo(flat, rows, cols, boxes, trail, mark)
+            backtracks += 1
+            continue
+        
+        bit = avail & -avail
+        avail ^= bit
+        mark = len(trail)
+        if _assign(flat, rows, cols, boxes, pos, bit, trail):
+            next_pos, next_avail = _select(flat, rows, cols, boxes, empties)
+            if next_pos == -1:
+                return True, backtracks
+            stack.append((pos, avail, mark))
+            pos, avail = next_pos, next_avail
+        else:
+            _undo(flat, rows, cols, boxes, trail, mark)
+            backtracks += 1
+
+
 def solve_sudoku(grid):
     """
-    Solve sudoku using backtracking.
+    Solve sudoku using backtracking with constraint propagation.
+    
+    Row, column and box constraints are tracked as 9-bit masks (bit d-1 set
+    when digit d is used), so candidate checks are a few integer ops.
     
+    Takes a flat 81-cell grid as returned by parse_grid.
     Returns: (solution_grid, time_ms, backtrack_count)
-    solution_grid is None if unsolvable.
+    solution_grid is a new flat grid, or None if unsolvable.
     """
     if grid is None:
         return None, 0, 0
     
-    # Deep copy
-    grid = [row[:] for row in grid]
-    
-    start_time = time.perf_counter()
-    backtrack_count = [0]  # Use list to allow modification in nested function
-    
-    def backtrack(pos):
-        if pos == 81:
-            return True
-        
-        row, col = pos // 9, pos % 9
-        
-        if grid[row][col] != 0:
-            return backtrack(pos + 1)
-        
-        for num in range(1, 10):
-            if is_valid(grid, row, col, num):
-                grid[row][col] = num
-                if backtrack(pos + 1):
-                    return True
-                grid[row][col] = 0
-                backtrack_count[0] += 1
-        
-        return False
-    
-    solved = backtrack(0)
-    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    start_ns = time.perf_counter_ns()
+    
+    # Single 81-byte copy; the caller's grid is left untouched
+    flat = bytearray(grid)
+    
+    rows, cols, boxes = [0] * 9, [0] * 9, [0] * 9
+    empties = []
+    for pos, v in enumerate(flat):
+        if v == 0:
+            empties.append(pos)
+            continue
+        r, c, b = ROW_OF[pos], COL_OF[pos], BOX_OF[pos]
+        bit = 1 << (v - 1)
+        if (rows[r] | cols[c] | boxes[b]) & bit:
+            # Conflicting clues
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            return None, elapsed_ms, 0
+        rows[r] |= bit
+        cols[c] |= bit
+        boxes[b] |= bit
+    
+    solved, backtrack_count = _solve(flat, rows, cols, boxes, empties)
+    elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
     
     if solved:
-        return grid, elapsed_ms, backtrack_count[0]
+        return flat, elapsed_ms, backtrack_count
     else:
-        return None, elapsed_ms, backtrack_count[0]
+        return None, elapsed_ms, backtrack_count
 
 
 def get_difficulty(clues, backtracks):
@@ -140,23 +348,22 @@ def get_difficulty(clues, backtracks):
     return ('Unknown', '❓')
 
 
+DIGITS = tuple(str(i) for i in range(10))
+DISPLAY_ROW = '{} {} {} | {} {} {} | {} {} {}'
+DISPLAY_SEPARATOR = '------+-------+------'
+
+
 def format_grid_display(grid):
     """Format grid for display with borders."""
     if grid is None:
         return None
     
     lines = []
-    for row_idx, row in enumerate(grid):
+    for row_idx in range(9):
         if row_idx > 0 and row_idx % 3 == 0:
-            lines.append('------+-------+------')
-        
-        parts = []
-        for col_idx, cell in enumerate(row):
-            if col_idx > 0 and col_idx % 3 == 0:
-                parts.append('|')
-            parts.append(str(cell))
-        
-        lines.append(' '.join(parts))
+            lines.append(DISPLAY_SEPARATOR)
+        row = grid[row_idx * 9:(row_idx + 1) * 9]
+        lines.append(DISPLAY_ROW.format(*[DIGITS[cell] for cell in row]))
     
     return '\n'.join(lines)
 
@@ -166,10 +373,8 @@ def grid_to_string(grid):
     if grid is None:
         return None
     
-    lines = []
-    for row in grid:
-        lines.append(''.join(str(cell) for cell in row))
-    return '\n'.join(lines)
+    cells = ''.join([DIGITS[cell] for cell in grid])
+    return '\n'.join(cells[i * 9:(i + 1) * 9] for i in range(9))
 
 
 def get_git_info():
@@ -181,188 +386,172 @@ def get_git_info():
         return 'unknown'
 
 
-def get_previous_solution():
-    """Read previous solution metadata from README if exists."""
-    readme_path = Path('README.md')
-    if not readme_path.exists():
+def find_section(content):
+    """
+    Locate the solve section in README content.
+    
+    Returns (start, end) slice bounds including both markers, or None.
+    """
+    start = content.find(SECTION_START)
+    if start == -1:
         return None
+    end = content.find(SECTION_END, start)
+    if end == -1:
+        return None
+    return start, end + SECTION_END_LEN
+
+
+def get_previous_solution(content=None):
+    """
+    Extract the previous solve section from README content.
     
-    try:
-        content = readme_path.read_text()
-        # Try to extract metadata from last solve block
-        match = re.search(r'<!-- SUDOKU-START -->.*?<!-- SUDOKU-END -->', content, re.DOTALL)
-        if match:
-            return match.group(0)
-    except Exception:
-        pass
+    Reads README.md when content is not supplied. Returns None if absent.
+    """
+    if content is None:
+        readme_path = Path('README.md')
+        if not readme_path.exists():
+            return None
+        try:
+            content = readme_path.read_text()
+        except Exception:
+            return None
+    
+    span = find_section(content)
+    if span:
+        return content[span[0]:span[1]]
     
     return None
 
 
-def create_history_file(original_grid, solution_grid, clues, backtracks, time_ms, sha):
+def place_section(section, content=None):
+    """
+    Put section into README content, replacing any existing solve section.
+    
+    content is read from README.md if None; a fresh README is built
+    when there is none.
+    """
+    if content is None:
+        readme_path = Path('README.md')
+        if readme_path.exists():
+            content = readme_path.read_text()
+    if content is None:
+        return README_TEMPLATE.substitute(section=section)
+    
+    span = find_section(content)
+    if span:
+        return content[:span[0]] + section + content[span[1]:]
+    if SECTION_START in content:
+        # Unterminated section: leave README as is
+        return content
+    
+    # Append before final marker if exists, else append
+    if 'Wubba lubba dub dub' in content:
+        return content.replace('Wubba lubba dub dub', f'{section}\n\nWubba lubba dub dub')
+    return content + f'\n\n{section}'
+
+
+def create_history_file(original_grid, solution_grid, clues, backtracks, time_ms, sha, timestamp):
     """Create history file with full metadata."""
     difficulty_name, difficulty_emoji = get_difficulty(clues, backtracks)
-    timestamp = datetime.utcnow().isoformat() + 'Z'
     
     original_str = grid_to_string(original_grid)
     solution_str = grid_to_string(solution_grid)
     solution_display = format_grid_display(solution_grid)
     
-    content = f"""# Sudoku Solution - {timestamp}
+    content = HISTORY_TEMPLATE.substitute(
+        timestamp=timestamp,
+        sha=sha,
+        difficulty_emoji=difficulty_emoji,
+        difficulty_name=difficulty_name,
+        clues=clues,
+        backtracks=backtracks,
+        time_ms=f'{time_ms:.2f}',
+        original_str=original_str,
+        solution_display=solution_display,
+        solution_str=solution_str,
+    )
+    return content, timestamp
 
-**Metadata**
-- Solved at: {timestamp} UTC
-- Commit: {sha}
-- Difficulty: {difficulty_emoji} {difficulty_name}
-- Clues: {clues}
-- Backtracks: {backtracks}
-- Time: {time_ms:.2f} ms
 
-**Original Puzzle**
-```
-{original_str}
-```
+def history_to_prune(max_keep, pending=()):
+    """
+    List history file paths beyond the newest max_keep.
+    
+    pending names files about to be written; they count towards max_keep
+    but are never returned for deletion.
+    """
+    try:
+        with os.scandir('history') as it:
+            names = {entry.name for entry in it
+                     if entry.name.startswith('solve-') and entry.name.endswith('.md')}
+    except OSError:
+        return []
+    
+    names.update(pending)
+    ordered = sorted(names, reverse=True)
+    return [os.path.join('history', name) for name in ordered[max_keep:] if name not in pending]
 
-**Solution**
-```
-{solution_display}
-```
 
-**Solution (compact)**
-```
-{solution_str}
-```
-"""
-    return content, timestamp
+def remove_history_files(paths):
+    """Unlink history files, ignoring ones already gone."""
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
 
 
 def prune_history(max_keep):
     """Remove oldest history files if count exceeds max_keep."""
-    history_dir = Path('history')
-    if not history_dir.exists():
-        return
-    
-    files = sorted(history_dir.glob('solve-*.md'), reverse=True)
-    
-    for old_file in files[max_keep:]:
-        try:
-            old_file.unlink()
-        except Exception:
-            pass
+    remove_history_files(history_to_prune(max_keep))
 
 
-def update_readme(original_grid, solution_grid, clues, backtracks, time_ms, sha):
-    """Update README with latest solution."""
+def render_readme(original_grid, solution_grid, clues, backtracks, time_ms, sha, timestamp, content=None):
+    """
+    Build README text with latest solution.
+    
+    content is the current README text; it is read from disk if None.
+    """
     difficulty_name, difficulty_emoji = get_difficulty(clues, backtracks)
-    timestamp = datetime.utcnow().isoformat() + 'Z'
     
     solution_display = format_grid_display(solution_grid)
     original_str = grid_to_string(original_grid)
     
-    solve_section = f"""<!-- SUDOKU-START -->
-
-**Latest Solve** • Solved in {time_ms:.0f} ms • Difficulty: {difficulty_emoji} {difficulty_name} • Backtracks: {backtracks} • Clues: {clues}
-
-{solution_display}
-
-**Original Puzzle**
-
-{original_str}
-
-Last solved: {timestamp} UTC (commit {sha})  
-View recent solves → ./history/
-
-<!-- SUDOKU-END -->"""
-    
-    readme_path = Path('README.md')
-    if readme_path.exists():
-        content = readme_path.read_text()
-        # Replace or insert solve section
-        if '<!-- SUDOKU-START -->' in content:
-            content = re.sub(
-                r'<!-- SUDOKU-START -->.*?<!-- SUDOKU-END -->',
-                solve_section,
-                content,
-                flags=re.DOTALL
-            )
-        else:
-            # Append before final marker if exists, else append
-            if 'Wubba lubba dub dub' in content:
-                content = content.replace('Wubba lubba dub dub', f'{solve_section}\n\nWubba lubba dub dub')
-            else:
-                content += f'\n\n{solve_section}'
-    else:
-        content = f"""# Sudoku Solver Portal
-
-Public 9×9 Sudoku solver running in GitHub Actions.  
-Submit puzzles easily via the web editor or by editing puzzle/current.txt → open PR → auto-merges if only that file changed.
-
-### Submit a Puzzle
-
-Visit the web editor at https://projectaberto.github.io/sudokusolver/ to fill the grid visually.
-
----
-
-   ~~~~~ Wubba Lubba Dub Dub ~~~~~ [burp] ~~~~~
-   ╔═══════════════════[ Latest Solve Portal ]═══════════════════╗
-
-{solve_section}
-
-Wubba lubba dub dub! 🚀
-"""
-    
-    readme_path.write_text(content)
-
-
-def update_readme_error(error_msg, original_str, sha):
-    """Update README with error entry instead of solution."""
-    timestamp = datetime.utcnow().isoformat() + 'Z'
-    
-    error_section = f"""<!-- SUDOKU-START -->
-
-**Error** ⚠️ Could not solve puzzle
-
-{error_msg}
-
-**Original Puzzle**
-
-{original_str}
-
-Last attempt: {timestamp} UTC (commit {sha})
-
-<!-- SUDOKU-END -->"""
-    
-    readme_path = Path('README.md')
-    if readme_path.exists():
-        content = readme_path.read_text()
-        if '<!-- SUDOKU-START -->' in content:
-            content = re.sub(
-                r'<!-- SUDOKU-START -->.*?<!-- SUDOKU-END -->',
-                error_section,
-                content,
-                flags=re.DOTALL
-            )
-        else:
-            if 'Wubba lubba dub dub' in content:
-                content = content.replace('Wubba lubba dub dub', f'{error_section}\n\nWubba lubba dub dub')
-            else:
-                content += f'\n\n{error_section}'
-    else:
-        content = f"""# Sudoku Solver Portal
+    solve_section = README_SOLVE_TEMPLATE.substitute(
+        time_ms=f'{time_ms:.0f}',
+        difficulty_emoji=difficulty_emoji,
+        difficulty_name=difficulty_name,
+        backtracks=backtracks,
+        clues=clues,
+        solution_display=solution_display,
+        original_str=original_str,
+        timestamp=timestamp,
+        sha=sha,
+    )
+    return place_section(solve_section, content)
 
-Public 9×9 Sudoku solver running in GitHub Actions.
 
----
-
-   ~~~~~ Wubba Lubba Dub Dub ~~~~~ [burp] ~~~~~
-   ╔═══════════════════[ Latest Solve Portal ]═══════════════════╗
+def update_readme(original_grid, solution_grid, clues, backtracks, time_ms, sha, timestamp, content=None):
+    """Update README with latest solution."""
+    content = render_readme(
+        original_grid, solution_grid, clues, backtracks, time_ms, sha, timestamp, content
+    )
+    Path('README.md').write_text(content)
 
-{error_section}
 
-Wubba lubba dub dub! 🚀
-"""
+def update_readme_error(error_msg, original_str, sha, timestamp, content=None):
+    """
+    Update README with error entry instead of solution.
     
-    readme_path.write_text(content)
+    content is the current README text; it is read from disk if None.
+    """
+    error_section = README_ERROR_TEMPLATE.substitute(
+        error_msg=error_msg,
+        original_str=original_str,
+        timestamp=timestamp,
+        sha=sha,
+    )
+    Path('README.md').write_text(place_section(error_section, content))
 
 
 def main():
@@ -380,14 +569,24 @@ def main():
         print(f'ERROR reading puzzle: {e}')
         sys.exit(1)
     
+    # Read README once; both update paths work on this content
+    readme_path = Path('README.md')
+    readme_content = readme_path.read_text() if readme_path.exists() else None
+    
+    # Commit and solve time are shared by README and history output
+    sha = get_git_info()
+    now = datetime.utcnow()
+    timestamp = now.isoformat() + 'Z'
+    
     # Parse grid
     original_grid = parse_grid(puzzle_str)
     if original_grid is None:
-        sha = get_git_info()
         update_readme_error(
             'Invalid puzzle format: must be 9×9 grid with digits 1-9 or . (empty)',
             puzzle_str.strip(),
-            sha
+            sha,
+            timestamp,
+            readme_content
         )
         print('ERROR: Invalid puzzle format')
         sys.exit(1)
@@ -396,33 +595,39 @@ def main():
     solution_grid, time_ms, backtracks = solve_sudoku(original_grid)
     
     if solution_grid is None:
-        sha = get_git_info()
         clues = count_clues(original_grid)
         update_readme_error(
             f'Puzzle is unsolvable (has {clues} clues)',
             puzzle_str.strip(),
-            sha
+            sha,
+            timestamp,
+            readme_content
         )
         print('ERROR: Puzzle unsolvable')
         sys.exit(1)
     
     # Success: update README and history
     clues = count_clues(original_grid)
-    sha = get_git_info()
-    
-    update_readme(original_grid, solution_grid, clues, backtracks, time_ms, sha)
     
-    # Create history file
-    history_content, timestamp = create_history_file(
-        original_grid, solution_grid, clues, backtracks, time_ms, sha
+    # Build all output up front, then overlap the independent disk writes
+    readme_text = render_readme(
+        original_grid, solution_grid, clues, backtracks, time_ms, sha, timestamp, readme_content
     )
-    
-    history_path = Path('history') / f'solve-{datetime.utcnow().strftime("%Y%m%d-%H%M%S")}-{sha}.md'
-    history_path.write_text(history_content)
-    
-    # Prune history
+    history_content, _ = create_history_file(
+        original_grid, solution_grid, clues, backtracks, time_ms, sha, timestamp
+    )
+    history_path = Path('history') / f'solve-{now.strftime("%Y%m%d-%H%M%S")}-{sha}.md'
     max_keep = int(os.environ.get('MAX_HISTORY_KEEP', '50'))
-    prune_history(max_keep)
+    stale_history = history_to_prune(max_keep, pending=(history_path.name,))
+    
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(readme_path.write_text, readme_text),
+            executor.submit(history_path.write_text, history_content),
+            executor.submit(remove_history_files, stale_history),
+        ]
+        for future in futures:
+            future.result()
     
     print(f'✓ Solved in {time_ms:.0f} ms ({backtracks} backtracks)')
     print(f'✓ Clues: {clues}, Difficulty: {get_difficulty(clues, backtracks)[0]}')
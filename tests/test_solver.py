@@ -12,6 +12,7 @@ from solver import (
     solve_sudoku,
     get_difficulty,
     grid_to_string,
+    grid_as_2d,
 )
 
 
@@ -31,11 +32,28 @@ class TestSudokuSolver(unittest.TestCase):
 ....8..79"""
         grid = parse_grid(puzzle)
         self.assertIsNotNone(grid)
-        self.assertEqual(len(grid), 9)
-        self.assertEqual(len(grid[0]), 9)
-        self.assertEqual(grid[0][0], 5)
-        self.assertEqual(grid[0][1], 3)
-        self.assertEqual(grid[0][2], 0)  # . becomes 0
+        self.assertEqual(len(grid), 81)
+        self.assertEqual(grid[0], 5)
+        self.assertEqual(grid[1], 3)
+        self.assertEqual(grid[2], 0)  # . becomes 0
+        self.assertEqual(grid[9], 6)  # first cell of second row
+    
+    def test_grid_as_2d(self):
+        """Test flat grid converts to 9x9 rows."""
+        puzzle = """53..7....
+6..195...
+.98....6.
+8...6...3
+4..8.3..1
+7...2...6
+.6....28.
+...419..5
+....8..79"""
+        rows = grid_as_2d(parse_grid(puzzle))
+        self.assertEqual(len(rows), 9)
+        self.assertEqual(rows[0], [5, 3, 0, 0, 7, 0, 0, 0, 0])
+        self.assertEqual(rows[8], [0, 0, 0, 0, 8, 0, 0, 7, 9])
+        self.assertIsNone(grid_as_2d(None))
     
     def test_parse_invalid_dimensions(self):
         """Test parsing fails with wrong dimensions."""
@@ -88,13 +106,62 @@ class TestSudokuSolver(unittest.TestCase):
         
         self.assertIsNotNone(solution)
         self.assertGreater(time_ms, 0)
-        self.assertGreater(backtracks, 0)
+        self.assertGreaterEqual(backtracks, 0)
         
         # Check solution is complete (all cells filled)
-        for row in solution:
-            for cell in row:
-                self.assertGreater(cell, 0)
-                self.assertLessEqual(cell, 9)
+        for cell in solution:
+            self.assertGreater(cell, 0)
+            self.assertLessEqual(cell, 9)
+    
+    def test_solve_hard_puzzle(self):
+        """Test solving a puzzle that needs guessing."""
+        puzzle = """8........
+..36.....
+.7..9.2..
+.5...7...
+....457..
+...1...3.
+..1....68
+..85...1.
+.9....4.."""
+        grid = grid_as_2d(parse_grid(puzzle))
+        solution, time_ms, backtracks = solve_sudoku(parse_grid(puzzle))
+        
+        self.assertIsNotNone(solution)
+        self.assertGreater(backtracks, 0)
+        solution = grid_as_2d(solution)
+        
+        # Clues preserved, every row/column/box holds 1-9 once
+        for r in range(9):
+            for c in range(9):
+                if grid[r][c]:
+                    self.assertEqual(solution[r][c], grid[r][c])
+        digits = set(range(1, 10))
+        for i in range(9):
+            self.assertEqual(set(solution[i]), digits)
+            self.assertEqual({solution[r][i] for r in range(9)}, digits)
+            br, bc = (i // 3) * 3, (i % 3) * 3
+            box = {solution[r][c] for r in range(br, br + 3) for c in range(bc, bc + 3)}
+            self.assertEqual(box, digits)
+    
+    def test_solve_does_not_mutate_input(self):
+        """Test solving returns a new grid and leaves the puzzle as given."""
+        puzzle = """53..7....
+6..195...
+.98....6.
+8...6...3
+4..8.3..1
+7...2...6
+.6....28.
+...419..5
+....8..79"""
+        grid = parse_grid(puzzle)
+        original = bytes(grid)
+        solution, time_ms, backtracks = solve_sudoku(grid)
+        
+        self.assertIsNotNone(solution)
+        self.assertIsNot(solution, grid)
+        self.assertEqual(bytes(grid), original)
     
     def test_solve_unsolvable(self):
         """Test that unsolvable puzzle returns None."""